@@ -3,22 +3,27 @@
 
 import os
 import re
+import shutil
 import subprocess
 import streamlit as st
 import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import yt_dlp
-import whisper
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import unicodedata
 import atexit
 import signal
-from typing import List, Dict, Optional
-from deep_translator import GoogleTranslator
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 from io import BytesIO
+from contextlib import contextmanager
+from html import escape
 
 # 모든 오디오 프로세스 정리 함수
 def cleanup_audio_processes():
@@ -39,9 +44,64 @@ def cleanup_audio_processes():
 # 앱 종료 시 자동 정리 등록
 atexit.register(cleanup_audio_processes)
 
+# 프로세스 종료 감시 (종료 시점에만 목록에서 제거)
+def _watch_audio_process(processes: Dict, video_id, process):
+    """백그라운드 스레드에서 프로세스 종료를 기다렸다가 등록 목록에서 제거"""
+    def _reap():
+        process.wait()
+        if processes.get(video_id) is process:
+            processes.pop(video_id, None)
+
+    threading.Thread(target=_reap, daemon=True).start()
+
+# 자주 쓰는 정규식 미리 컴파일
+_WS_RE = re.compile(r"\s+")
+# 문장: 줄 안에서 공백/끝이 뒤따르는 종료 기호까지, 없으면 줄 끝까지
+_SENT_ITER_RE = re.compile(r'[^\n]*?[.!?]+(?=\s|$)|[^\n]+')
+_ASCII_RE = re.compile(r'^[A-Za-z0-9\s.,!?\'"-]+$')
+_CHANNEL_ID_RE = re.compile(r'UC[\w-]{22}')
+
+# 파일명 금지 문자는 공백으로, 제어 문자는 삭제하는 변환 테이블
+_FILESAFE_TABLE = {**{i: None for i in range(0x20)}, **{ord(c): 0x20 for c in '<>:\\/|?*"'}}
+
+# yt-dlp 인스턴스 재사용 (옵션 조합별 풀에서 빌려 쓰고 반납하여 HTTPS 연결 풀 공유)
+# YoutubeDL은 스레드 간 동시 사용이 불가하므로 한 번에 한 스레드만 인스턴스를 사용
+_YDL_POOL: Dict[frozenset, List[yt_dlp.YoutubeDL]] = {}
+_YDL_INSTANCES: List[yt_dlp.YoutubeDL] = []
+_YDL_LOCK = threading.Lock()
+
+@contextmanager
+def _borrow_ydl(opts: Dict):
+    """옵션 조합별 풀에서 YoutubeDL 인스턴스를 빌려오고, 사용 후 반납"""
+    key = frozenset(opts.items())
+    with _YDL_LOCK:
+        free = _YDL_POOL.setdefault(key, [])
+        ydl = free.pop() if free else None
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(dict(opts))
+            _YDL_INSTANCES.append(ydl)
+    try:
+        yield ydl
+    finally:
+        with _YDL_LOCK:
+            _YDL_POOL[key].append(ydl)
+
+def close_ydl_instances():
+    """생성된 YoutubeDL 인스턴스 모두 닫기"""
+    with _YDL_LOCK:
+        for ydl in _YDL_INSTANCES:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+        _YDL_INSTANCES.clear()
+        _YDL_POOL.clear()
+
+atexit.register(close_ydl_instances)
+
 # 텍스트 정리 함수
 def clean_text(text):
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     return text
 
 # 유니코드 정규화 함수
@@ -49,92 +109,166 @@ def _normalize_visible_text(text: str) -> str:
     """유니코드 수학 볼드 등 특수 스타일 문자를 일반 문자로 정규화."""
     if not text:
         return ""
+    # ASCII 문자열은 분해할 것이 없으므로 공백 정리만 수행
+    if text.isascii():
+        return _WS_RE.sub(" ", text).strip()
     # NFKD 정규화로 호환 분해 후 결합 부호 제거
     decomposed = unicodedata.normalize('NFKD', text)
     without_marks = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
     # 가시성 향상을 위해 공백 정리
-    normalized_spaces = re.sub(r"\s+", " ", without_marks).strip()
+    normalized_spaces = _WS_RE.sub(" ", without_marks).strip()
     return normalized_spaces
 
 # 파일 이름 안전화 함수
 def make_filesafe_title(title: str) -> str:
     """Windows에서도 안전한 파일명으로 변환."""
     base = _normalize_visible_text(title) or "script"
-    # 금지 문자 제거
-    base = re.sub(r"[<>:\\/\\|?*\"]", " ", base)
-    # 제어 문자 제거
-    base = ''.join(ch for ch in base if ch >= ' ')
+    # 금지 문자 및 제어 문자 제거 (한 번의 translate로 처리)
+    base = base.translate(_FILESAFE_TABLE)
     # 앞뒤 공백/점 제거, 연속 공백 축소
-    base = re.sub(r"\s+", "_", base).strip().rstrip('_')
+    base = _WS_RE.sub("_", base).strip().rstrip('_')
     # 길이 제한
     if len(base) > 150:
         base = base[:150].rstrip('_')
     # 빈 문자열 방지
     return base or "script"
 
-# 오디오 다운로드
-def download_audio(video_url, filename="audio.mp3"):
-    ydl_opts = {
-        'format': 'bestaudio/best',
-        'outtmpl': filename,
-        'quiet': True
-    }
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        ydl.download([video_url])
-    return filename
+# 오디오를 16kHz 모노 PCM으로 메모리에 로드 (임시 파일 없이 ffmpeg 파이프 사용)
+def load_audio_pcm(video_url, sample_rate=16000) -> np.ndarray:
+    audio_url = get_audio_url(video_url)
+    cmd = [
+        "ffmpeg", "-nostdin", "-loglevel", "quiet",
+        "-i", audio_url,
+        "-ar", str(sample_rate), "-ac", "1", "-f", "s16le", "pipe:1",
+    ]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, check=True)
+    return np.frombuffer(proc.stdout, np.int16).astype(np.float32) / 32768.0
 
-# 유튜브 자막 또는 Whisper로 스크립트 추출
-def get_youtube_script(video_url, lang="en", title="content"):
-    video_id = video_url.split("v=")[-1].split("&")[0]
-    text_result = None
+_WHISPER_LOCK = threading.Lock()
+
+# Whisper 모델 로드 (GPU 가능 시 int8_float16, 아니면 CPU int8)
+@st.cache_resource(show_spinner=False)
+def _get_whisper_model(name: str = "small"):
+    """faster-whisper 모델을 한 번만 로드하여 재사용"""
+    # 무거운 모듈은 실제 전사 시에만 로드
+    from faster_whisper import WhisperModel
+    try:
+        import ctranslate2
+        if ctranslate2.get_cuda_device_count() > 0 and \
+           'int8_float16' in ctranslate2.get_supported_compute_types('cuda'):
+            return WhisperModel(name, device="cuda", compute_type="int8_float16")
+    except Exception:
+        pass
+    return WhisperModel(name, device="cpu", compute_type="int8")
 
-    safe_title = make_filesafe_title(title)
+# 자막 API용 공유 HTTP 세션 (연결 풀 + 재시도)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
+_TRANSCRIPT_API = YouTubeTranscriptApi(http_client=_SESSION)
+
+# 유튜브 자막 또는 Whisper로 스크립트 추출 (성공한 결과만 캐시, 실패는 예외로 전달)
+@st.cache_data(show_spinner=False, ttl=3600)
+def _fetch_youtube_script(video_url, lang="en"):
+    video_id = video_url.split("v=")[-1].split("&")[0]
 
     try:
-        transcript_api = YouTubeTranscriptApi()
-        fetched_transcript = transcript_api.fetch(video_id, languages=[lang, 'en', 'ko'])
-        # FetchedTranscript 객체를 리스트로 변환 (각 항목은 FetchedTranscriptSnippet 객체)
-        transcript_list = list(fetched_transcript)
-        text_result = " ".join([t.text for t in transcript_list])
-        text_result = clean_text(text_result)
+        languages = ('en', 'ko') if lang == 'en' else (lang, 'en', 'ko')
+        fetched_transcript = _TRANSCRIPT_API.fetch(video_id, languages=languages)
+        # FetchedTranscript의 각 항목(FetchedTranscriptSnippet)을 바로 이어 붙임
+        text_result = clean_text(" ".join(t.text for t in fetched_transcript))
     except (TranscriptsDisabled, NoTranscriptFound):
-        try:
-            audio_file = download_audio(video_url)
-            model = whisper.load_model("small")
-            result = model.transcribe(audio_file)
-            text_result = clean_text(result['text'])
-            # 임시 오디오 파일 삭제
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-        except Exception as e:
-            return None
-    except Exception as e:
-        return None
+        audio_array = load_audio_pcm(video_url)
+        model = _get_whisper_model()
+        # 하나의 캐시된 모델에서 동시 디코딩이 겹치지 않도록 직렬화 (segments는 지연 생성되므로 join까지 포함)
+        with _WHISPER_LOCK:
+            # VAD로 무음 구간을 건너뛰어 디코딩 단계 축소
+            segments, _ = model.transcribe(audio_array, beam_size=1, vad_filter=True)
+            text_result = clean_text(" ".join(seg.text for seg in segments))
 
     # 자동 파일 저장 제거 (원문/번역은 메모리에서만 관리)
 
     return text_result
 
-# 오디오만 재생
-def play_audio_only(video_url):
+def get_youtube_script(video_url, lang="en", title="content"):
+    try:
+        return _fetch_youtube_script(video_url, lang)
+    except Exception as e:
+        return None
+
+# 오디오 스트림 URL 추출
+def get_audio_url(video_url: str) -> str:
     ydl_opts = {'format': 'bestaudio/best', 'quiet': True}
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    with _borrow_ydl(ydl_opts) as ydl:
         info = ydl.extract_info(video_url, download=False)
-        audio_url = info['url']
-    
+    return info['url']
+
+# 오디오 URL 캐시 (googlevideo URL은 몇 시간 후 만료되므로 시간 기록)
+_AUDIO_URL_TTL = 2 * 60 * 60
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+def get_cached_audio_url(cache: Dict, video: Dict) -> str:
+    """캐시가 유효하면 그대로, 없거나 오래되었으면 다시 추출하여 캐시에 저장"""
+    entry = cache.get(video['id'])
+    if entry and time.time() - entry['time'] < _AUDIO_URL_TTL:
+        return entry['url']
+    audio_url = get_audio_url(video['url'])
+    cache[video['id']] = {'url': audio_url, 'time': time.time()}
+    return audio_url
+
+def prefetch_audio_urls(cache: Dict, videos: List[Dict]):
+    """영상 목록의 오디오 URL을 백그라운드에서 미리 가져오기 (화면 갱신을 막지 않음)"""
+    def _fetch(video):
+        try:
+            get_cached_audio_url(cache, video)
+        except Exception:
+            pass
+
+    for video in videos:
+        _PREFETCH_EXECUTOR.submit(_fetch, video)
+
+# ffplay 실행 파일 경로 탐색 (모듈 로드 시 한 번만 수행)
+def _discover_ffplay() -> Optional[str]:
     # FFmpeg 경로 설정
     ffmpeg_path = os.getenv("FFMPEG_PATH", "C:\\ffmpeg")
-    ffplay_path = os.path.join(ffmpeg_path, "bin", "ffplay.exe")
-    
-    # FFplay 실행 파일이 존재하는지 확인
-    if not os.path.exists(ffplay_path):
+    for candidate in (
+        os.path.join(ffmpeg_path, "bin", "ffplay.exe"),
         # bin 폴더가 없으면 직접 경로 확인
-        ffplay_path = os.path.join(ffmpeg_path, "ffplay.exe")
-        if not os.path.exists(ffplay_path):
-            # PATH에서 ffplay 찾기
-            ffplay_path = "ffplay"
+        os.path.join(ffmpeg_path, "ffplay.exe"),
+    ):
+        if os.path.exists(candidate):
+            return candidate
+    # PATH에서 ffplay 찾기
+    return shutil.which("ffplay")
+
+_FFPLAY_PATH = _discover_ffplay()
+
+# 오디오만 재생
+def play_audio_only(video_url, video_id=None):
+    if not _FFPLAY_PATH:
+        raise FileNotFoundError("ffplay를 찾을 수 없습니다. FFMPEG_PATH 또는 PATH를 확인해주세요.")
+    ffplay_path = _FFPLAY_PATH
+
+    audio_url = get_audio_url(video_url)
+    if video_id is None:
+        video_id = video_url.split("v=")[-1].split("&")[0]
     
-    subprocess.run([ffplay_path, "-nodisp", "-autoexit", "-loglevel", "quiet", audio_url])
+    # 비블로킹 실행 + 저지연 옵션 (버퍼링/프로빙 최소화)
+    proc = subprocess.Popen([
+        ffplay_path, "-nodisp", "-autoexit", "-loglevel", "quiet",
+        "-fflags", "nobuffer", "-flags", "low_delay",
+        "-probesize", "32", "-analyzeduration", "0",
+        audio_url,
+    ])
+    # 정리 함수가 종료할 수 있도록 세션 상태에 등록
+    if 'audio_processes' not in st.session_state:
+        st.session_state.audio_processes = {}
+    st.session_state.audio_processes[video_id] = proc
+    _watch_audio_process(st.session_state.audio_processes, video_id, proc)
+    return proc
 
 # 채널 영상 목록 가져오기 함수들
 def get_channel_videos(channel_name: str, max_results: int = 10) -> List[Dict]:
@@ -152,93 +286,83 @@ def get_channel_videos(channel_name: str, max_results: int = 10) -> List[Dict]:
         'quiet': True,
         'no_warnings': True,
         'extract_flat': True,
+        'playlistend': max_results,
+        'playlist_items': f'1-{max_results}',
     }
     
+    # 방법 1: 채널명으로 채널 URL을 바로 구성하여 한 번만 조회
     try:
-        with yt_dlp.YoutubeDL(search_opts) as ydl:
-            # 방법 1: 채널명으로 검색하여 채널 URL 찾기
-            try:
-                search_query = f"ytsearch1:{channel_name}"
-                info = ydl.extract_info(search_query, download=False)
-                
-                if info and 'entries' in info and len(info['entries']) > 0:
-                    first_result = info['entries'][0]
-                    channel_id = first_result.get('channel_id') or first_result.get('channel')
-                    channel_name_found = first_result.get('channel')
-                    
-                    if channel_id or channel_name_found:
-                        # 채널 URL 구성
-                        if channel_id:
-                            if channel_id.startswith('@') or channel_id.startswith('UC'):
-                                if channel_id.startswith('@'):
-                                    channel_url = f"https://www.youtube.com/{channel_id}/videos"
-                                else:
-                                    channel_url = f"https://www.youtube.com/channel/{channel_id}/videos"
-                            else:
-                                channel_url = f"https://www.youtube.com/channel/{channel_id}/videos"
-                        elif channel_name_found:
-                            channel_url = f"https://www.youtube.com/c/{channel_name_found}/videos"
-                        else:
-                            channel_url = None
-                        
-                        if channel_url:
-                            return _get_videos_from_url(channel_url, max_results)
-            except Exception as e:
-                pass
-            
-            # 방법 2: 직접 채널 URL 시도
-            possible_urls = [
-                f"https://www.youtube.com/@{channel_name}/videos",
-                f"https://www.youtube.com/c/{channel_name}/videos",
-                f"https://www.youtube.com/user/{channel_name}/videos",
-                f"https://www.youtube.com/channel/{channel_name}/videos",
-            ]
-            
-            for url in possible_urls:
-                try:
-                    videos = _get_videos_from_url(url, max_results)
-                    if videos:
-                        return videos
-                except Exception:
-                    continue
-            
-            return []
-            
+        videos = _get_videos_from_url(_resolve_channel_url(channel_name), max_results)
+        if videos:
+            return videos
+    except Exception:
+        pass
+    
+    # 방법 2: 실패 시에만 채널명으로 검색하여 채널 URL 찾기
+    try:
+        with _borrow_ydl(search_opts) as ydl:
+            info = ydl.extract_info(f"ytsearch1:{channel_name}", download=False)
+        
+        if info and info.get('entries'):
+            first_result = info['entries'][0]
+            channel_id = first_result.get('channel_id')
+            if channel_id:
+                return _get_videos_from_url(_resolve_channel_url(channel_id), max_results) or []
+        
+        return []
+        
     except Exception as e:
         st.error(f"오류 발생: {e}")
         return []
 
+def _resolve_channel_url(name: str) -> str:
+    """채널명/핸들/채널 ID를 채널 영상 탭 URL로 변환"""
+    name = name.strip().strip('/')
+    if _CHANNEL_ID_RE.fullmatch(name):
+        return f"https://www.youtube.com/channel/{name}/videos"
+    if name.startswith('@'):
+        return f"https://www.youtube.com/{name}/videos"
+    if name.startswith(('c/', 'user/', 'channel/')):
+        return f"https://www.youtube.com/{name}/videos"
+    return f"https://www.youtube.com/@{name.replace(' ', '')}/videos"
+
 def _get_videos_from_url(channel_url: str, max_results: int = 10) -> List[Dict]:
     """채널 URL로부터 영상 목록 가져오기"""
     channel_opts = {
         'quiet': True,
         'no_warnings': True,
         'extract_flat': True,
+        'playlistend': max_results,
+        'playlist_items': f'1-{max_results}',
     }
     
     try:
-        with yt_dlp.YoutubeDL(channel_opts) as ydl:
+        with _borrow_ydl(channel_opts) as ydl:
             channel_info = ydl.extract_info(channel_url, download=False)
-            
-            if channel_info and 'entries' in channel_info:
-                videos = []
-                for i, entry in enumerate(channel_info['entries'][:max_results], 1):
-                    video_id = entry.get('id')
-                    if not video_id:
-                        continue
-                    title = entry.get('title', '제목 없음')
-                    url = entry.get('url') or f"https://www.youtube.com/watch?v={video_id}"
-                    duration = entry.get('duration', 0)
-                    
-                    videos.append({
-                        'index': i,
-                        'title': title,
-                        'url': url,
-                        'id': video_id,
-                        'duration': duration
-                    })
+        
+        if channel_info and 'entries' in channel_info:
+            videos = []
+            # yt-dlp가 playlist_items로 이미 잘라서 반환
+            for i, entry in enumerate(channel_info['entries'], 1):
+                video_id = entry.get('id')
+                if not video_id:
+                    continue
+                title = entry.get('title', '제목 없음')
+                url = entry.get('url') or f"https://www.youtube.com/watch?v={video_id}"
+                duration = entry.get('duration', 0)
                 
-                return videos if videos else None
+                videos.append({
+                    'index': i,
+                    'title': title,
+                    # 표시용/파일명용 제목은 목록 생성 시 한 번만 정규화
+                    'title_display': _normalize_visible_text(title),
+                    'title_safe': make_filesafe_title(title),
+                    'url': url,
+                    'id': video_id,
+                    'duration': duration
+                })
+            
+            return videos if videos else None
     except Exception as e:
         raise Exception(f"URL에서 영상 목록 가져오기 실패: {e}")
 
@@ -260,33 +384,72 @@ def format_duration(seconds) -> str:
 # 스크립트를 문장 단위로 분할
 def split_into_sentences(text: str) -> List[str]:
     """텍스트를 문장 단위로 분할 (문장 종료 기호 기준)"""
-    paragraphs = text.split('\n')
-    
-    result = []
-    for para in paragraphs:
-        if not para.strip():
-            continue
-        
-        sentences = re.split(r'([.!?]+\s+)', para)
-        
-        current = ""
-        for part in sentences:
-            if not part:
-                continue
-            current += part
-            if re.search(r'[.!?]+\s*$', current):
-                if current.strip():
-                    result.append(current.strip())
-                    current = ""
-        
-        if current.strip():
-            result.append(current.strip())
-    
+    sentences = (m.group(0).strip() for m in _SENT_ITER_RE.finditer(text))
+    result = [sentence for sentence in sentences if sentence]
     return result if result else [text]
 
+# 번역 함수 (문장 단위로 묶어 병렬 번역)
+def translate_text(text: str, source: str = 'en', target: str = 'ko',
+                   chunk_size: int = 1500, max_workers: int = 4) -> Optional[str]:
+    """텍스트를 chunk_size 이하 조각으로 나눠 병렬 번역 (실패한 조각은 원문 유지)"""
+    from deep_translator import GoogleTranslator
+
+    # chunk_size보다 긴 문장(구두점 없는 자동 자막 등)은 공백 기준으로 다시 분할
+    pieces = []
+    for sentence in split_into_sentences(text):
+        if len(sentence) <= chunk_size:
+            pieces.append(sentence)
+            continue
+        for word in sentence.split():
+            pieces.extend(word[i:i + chunk_size] for i in range(0, len(word), chunk_size))
+
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) + 1 > chunk_size:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+
+    failed = []
+
+    def _translate(chunk):
+        # GoogleTranslator는 요청 파라미터를 인스턴스에 저장하므로 스레드 간 공유 불가
+        try:
+            translator = GoogleTranslator(source=source, target=target)
+            return translator.translate(chunk) or chunk
+        except Exception:
+            failed.append(chunk)
+            return chunk
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        translated = list(executor.map(_translate, chunks))
+
+    # 모든 조각이 실패하면 번역 없음으로 처리
+    if len(failed) == len(chunks):
+        return None
+    return " ".join(translated)
+
+# 문장별 Paragraph와 간격 목록 생성
+def _sentence_flowables(text: str, style) -> List:
+    from reportlab.platypus import Paragraph, Spacer
+    from reportlab.lib.units import inch
+    paragraphs = [Paragraph(escape(s, quote=False), style) for s in split_into_sentences(text) if s.strip()]
+    # Spacer는 페이지 넘김 시 상태(_postponed)가 바뀌므로 문장마다 새로 생성
+    return [x for p in paragraphs for x in (p, Spacer(1, 0.1*inch))]
+
 # PDF 생성 함수
 def create_pdf_from_text(text: str, title: str, translated_text: Optional[str] = None) -> bytes:
     """텍스트를 PDF로 변환"""
+    # reportlab은 PDF 생성 시에만 로드
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
     
@@ -316,12 +479,7 @@ def create_pdf_from_text(text: str, title: str, translated_text: Optional[str] =
     
     # 원문 추가 (Original 제목 없이)
     # 텍스트를 문장 단위로 분할하여 PDF에 추가
-    sentences = split_into_sentences(text)
-    for sentence in sentences:
-        if sentence.strip():
-            sentence_escaped = sentence.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(sentence_escaped, body_style))
-            story.append(Spacer(1, 0.1*inch))
+    story.extend(_sentence_flowables(text, body_style))
     
     # 번역문이 있으면 추가
     if translated_text:
@@ -329,17 +487,68 @@ def create_pdf_from_text(text: str, title: str, translated_text: Optional[str] =
         story.append(Paragraph("<b>번역 (Translation)</b>", styles['Heading2']))
         story.append(Spacer(1, 0.1*inch))
         
-        translated_sentences = split_into_sentences(translated_text)
-        for sentence in translated_sentences:
-            if sentence.strip():
-                sentence_escaped = sentence.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                story.append(Paragraph(sentence_escaped, body_style))
-                story.append(Spacer(1, 0.1*inch))
+        story.extend(_sentence_flowables(translated_text, body_style))
     
     doc.build(story)
     buffer.seek(0)
     return buffer.getvalue()
 
+# 영상 하나의 스크립트/번역/PDF 결과 생성
+def build_script_result(video: Dict, translate_workers: int = 4) -> Optional[Dict]:
+    """스크립트 추출 후 번역과 PDF까지 포함한 결과 반환 (실패 시 None)"""
+    safe_title = video['title_safe']
+    script_text = get_youtube_script(video['url'], title=safe_title)
+    if not script_text:
+        return None
+
+    # 필요 시 번역을 메모리에서 수행
+    translated_text = None
+    if _ASCII_RE.match(script_text[:200]):
+        try:
+            translated_text = translate_text(script_text, max_workers=translate_workers)
+        except Exception:
+            translated_text = None
+
+    # PDF는 추출 시 한 번만 생성하여 재실행마다 다시 만들지 않음
+    # (PDF 생성 실패가 이미 가져온 스크립트를 버리지 않도록 None으로 기록)
+    try:
+        pdf_data = create_pdf_from_text(
+            script_text,
+            safe_title.replace('_', ' '),
+            translated_text
+        )
+    except Exception:
+        pdf_data = None
+    return {
+        'title': safe_title,
+        'script': script_text,
+        'translated': translated_text,
+        'pdf': pdf_data,
+        'url': video['url']
+    }
+
+def build_script_results(videos: List[Dict], max_workers: int = 4) -> Tuple[Dict[str, Dict], List[Dict]]:
+    """여러 영상의 스크립트를 병렬로 추출 (성공 결과와 실패한 영상 목록 반환)"""
+    # 공유 자막 세션은 잠금 없이 사용: urllib3 연결 풀과 쿠키 저장소(자체 RLock 보유)가 스레드 안전
+    def _build(video):
+        try:
+            # 전체 동시 요청 수를 max_workers로 제한하기 위해 영상 내 번역은 직렬 수행
+            return video, build_script_result(video, translate_workers=1)
+        except Exception:
+            return video, None
+
+    # 작업 스레드에서도 캐시된 함수(_fetch_youtube_script, _get_whisper_model)를 쓰므로
+    # 현재 스크립트 실행 컨텍스트를 연결하여 ScriptRunContext 누락 경고 방지
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as executor:
+        results = list(executor.map(_build, videos))
+    succeeded = {video['id']: result for video, result in results if result}
+    failed = [video for video, result in results if not result]
+    return succeeded, failed
+
 # Streamlit UI
 def main():
     """Streamlit 메인 앱"""
@@ -359,15 +568,12 @@ def main():
         st.session_state.script_results = {}
     if 'audio_processes' not in st.session_state:
         st.session_state.audio_processes = {}
+    if 'audio_url_cache' not in st.session_state:
+        st.session_state.audio_url_cache = {}
     if 'browser_audio' not in st.session_state:
         st.session_state.browser_audio = { 'playing': False, 'url': None }
     
-    # 종료된 프로세스 정리
-    if 'audio_processes' in st.session_state:
-        for video_id, process in list(st.session_state.audio_processes.items()):
-            if process and process.poll() is not None:
-                # 프로세스가 이미 종료됨
-                del st.session_state.audio_processes[video_id]
+    # 종료된 프로세스는 _watch_audio_process가 종료 시점에 정리
     
     # 사이드바
     with st.sidebar:
@@ -418,6 +624,7 @@ def main():
                     videos = get_channel_videos(fallback_name, max_results=10)
                 if videos:
                     st.session_state.videos = videos
+                    prefetch_audio_urls(st.session_state.audio_url_cache, videos)
                     st.success(f"✅ {len(videos)}개의 영상을 찾았습니다!")
                     st.session_state.channel_input_value = ""
                     st.session_state.input_key += 1  # 입력창 key 변경으로 강제 재생성
@@ -460,6 +667,7 @@ def main():
                 
                 if videos:
                     st.session_state.videos = videos
+                    prefetch_audio_urls(st.session_state.audio_url_cache, videos)
                     st.success(f"✅ {len(videos)}개의 영상을 찾았습니다!")
                 else:
                     st.error("❌ 영상을 찾을 수 없습니다. 채널명 또는 URL을 확인해주세요.")
@@ -480,6 +688,21 @@ def main():
         st.markdown("---")
         st.subheader(f"📹 영상 목록 ({len(st.session_state.videos)}개)")
         
+        # 아직 추출하지 않은 영상 전체를 병렬 추출
+        if st.button("📜 전체 추출", key="extract_all"):
+            pending = [v for v in st.session_state.videos if v['id'] not in st.session_state.script_results]
+            if pending:
+                with st.spinner(f"{len(pending)}개 영상의 스크립트를 추출하는 중..."):
+                    succeeded, failed = build_script_results(pending)
+                st.session_state.script_results.update(succeeded)
+                # 재실행 후에도 보이도록 실패 목록을 세션에 보관
+                st.session_state.bulk_failed = [v['title_display'] for v in failed]
+                st.rerun()
+        
+        bulk_failed = st.session_state.pop('bulk_failed', None)
+        if bulk_failed:
+            st.warning("⚠️ 스크립트를 추출하지 못한 영상: " + ", ".join(bulk_failed))
+        
         videos_container = st.container()
         
         with videos_container:
@@ -490,24 +713,9 @@ def main():
                     # 스크립트 추출 버튼
                     extract_key = f"extract_{video['id']}"
                     if st.button("📜 추출", key=extract_key, use_container_width=True):
-                        safe_title = make_filesafe_title(video['title'])
-                        script_text = get_youtube_script(video['url'], title=safe_title)
-                        if script_text:
-                            # 필요 시 번역을 메모리에서 수행
-                            translated_text = None
-                            if re.match(r'^[A-Za-z0-9\s.,!?\'"-]+$', script_text[:200]):
-                                try:
-                                    translator = GoogleTranslator(source='en', target='ko')
-                                    translated_text = translator.translate(script_text)
-                                except Exception:
-                                    translated_text = None
-
-                            st.session_state.script_results[video['id']] = {
-                                'title': safe_title,
-                                'script': script_text,
-                                'translated': translated_text,
-                                'url': video['url']
-                            }
+                        result = build_script_result(video)
+                        if result:
+                            st.session_state.script_results[video['id']] = result
                             st.rerun()
                     
                     # 오디오 재생/정지 버튼 (브라우저 오디오 사용 - 창 닫히면 자동 종료)
@@ -523,12 +731,12 @@ def main():
                         if is_playing:
                             # 정지: 브라우저 오디오 제거
                             st.session_state.browser_audio = { 'playing': False, 'url': None, 'video_id': None }
+                            # 브라우저 재생 실패는 서버에서 알 수 없으므로, 다음 재생 시 URL을 새로 추출
+                            st.session_state.audio_url_cache.pop(video_id, None)
                         else:
                             try:
-                                ydl_opts = {'format': 'bestaudio/best', 'quiet': True}
-                                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                                    info = ydl.extract_info(video['url'], download=False)
-                                    audio_url = info['url']
+                                # 미리 가져온 URL이 유효하면 사용, 없거나 만료되었으면 동기 추출
+                                audio_url = get_cached_audio_url(st.session_state.audio_url_cache, video)
                                 st.session_state.browser_audio = { 'playing': True, 'url': audio_url, 'video_id': video_id }
                             except Exception:
                                 st.session_state.browser_audio = { 'playing': False, 'url': None, 'video_id': None }
@@ -548,9 +756,7 @@ def main():
                 with col2:
                     duration_str = format_duration(video.get('duration', 0))
                     # 제목을 기본 폰트/기본 굵기로 보이도록 정규화하여 출력
-                    title_norm = unicodedata.normalize('NFKD', video['title'])
-                    title_norm = ''.join(c for c in title_norm if unicodedata.category(c) != 'Mn')
-                    st.markdown(f"<div style='font-size: 20px; font-weight: 400; margin-bottom: 5px;'>{title_norm}</div>", unsafe_allow_html=True)
+                    st.markdown(f"<div style='font-size: 20px; font-weight: 400; margin-bottom: 5px;'>{video['title_display']}</div>", unsafe_allow_html=True)
                     st.markdown(f"<p style='color: #666; margin-top: 5px;'>⏱️ {duration_str} | 🔗 <a href='{video['url']}' target='_blank'>YouTube 보기</a></p>", unsafe_allow_html=True)
                     
                     # 스크립트 결과가 있으면 표시
@@ -580,15 +786,11 @@ def main():
                         
                         with col_dl2:
                             # PDF 다운로드 (메모리 데이터 사용)
-                            script_text = result.get('script') or ""
-                            translated_text = result.get('translated')
-                            if script_text:
+                            pdf_data = result.get('pdf')
+                            if pdf_data is None:
+                                st.caption("⚠️ PDF 생성 실패")
+                            else:
                                 display_title = result['title'].replace('_', ' ')
-                                pdf_data = create_pdf_from_text(
-                                    script_text,
-                                    display_title,
-                                    translated_text
-                                )
                                 pdf_filename = f"{display_title}.pdf"
                                 st.download_button(
                                     label="📄 PDF 다운로드",